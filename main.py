@@ -86,6 +86,14 @@ def main() -> None:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # libuv-based event loop for the download pipeline where available (not on Windows)
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     if args.update:
         from main.updater import GitHubUpdater
         updater = GitHubUpdater()
@@ -141,73 +149,49 @@ def main() -> None:
                 console.print("[red]Please provide work codes to list (e.g., ./asmr --list RJ123456 or VJ123456)[/red]")
                 sys.exit(1)
             
-            async def list_rj(work_code):
+            async def list_rj(kernel, work_code):
+                meta_raw = await kernel.fetch(f"/api/workInfo/{work_code}")
+                track_lookup_id = get_track_lookup_id(meta_raw, work_code) if meta_raw else work_code
+                tracks_raw = await kernel.fetch(f"/api/tracks/{track_lookup_id}?v=2")
+                if not meta_raw or not tracks_raw:
+                    console.print(f"[red]Failed to fetch info for {work_code}[/red]")
+                    return
+                
+                orc = Orchestrator(kernel, app.config, app.db)
+                source_code = get_source_code(meta_raw, work_code)
+                
+                meta = WorkMetadata(
+                    rj_id=source_code,
+                    title=meta_raw.get('title', 'Unknown'),
+                    circle=get_circle_name(meta_raw),
+                    cv=[v['name'] for v in meta_raw.get('vas', [])],
+                    tags=[get_localized_tag_name(t, getattr(app.config, 'tag_language_priority', None)) for t in meta_raw.get('tags', [])],
+                    price=meta_raw.get('price', 0),
+                    source_url=meta_raw.get('source_url', ''),
+                    dl_count=meta_raw.get('dl_count', 0),
+                    rating=meta_raw.get('rate_average_2dp', 0.0),
+                    release_date=meta_raw.get('release_date', ''),
+                    cover_url=meta_raw.get('mainCoverUrl', '')
+                )
+                root = orc.get_save_path(meta)
+                hierarchy = orc.parse_hierarchy(tracks_raw, root, root)
+                app.print_hierarchy(meta, hierarchy)
+            
+            async def list_all(codes):
                 kernel = NetworkKernel(app.config)
                 try:
-                    meta_raw = await kernel.fetch(f"/api/workInfo/{work_code}")
-                    track_lookup_id = get_track_lookup_id(meta_raw, work_code) if meta_raw else work_code
-                    tracks_raw = await kernel.fetch(f"/api/tracks/{track_lookup_id}?v=2")
-                    if not meta_raw or not tracks_raw:
-                        console.print(f"[red]Failed to fetch info for {work_code}[/red]")
-                        return
-                    
-                    orc = Orchestrator(kernel, app.config, app.db)
-                    source_code = get_source_code(meta_raw, work_code)
-                    
-                    meta = WorkMetadata(
-                        rj_id=source_code,
-                        title=meta_raw.get('title', 'Unknown'),
-                        circle=get_circle_name(meta_raw),
-                        cv=[v['name'] for v in meta_raw.get('vas', [])],
-                        tags=[get_localized_tag_name(t, getattr(app.config, 'tag_language_priority', None)) for t in meta_raw.get('tags', [])],
-                        price=meta_raw.get('price', 0),
-                        source_url=meta_raw.get('source_url', ''),
-                        dl_count=meta_raw.get('dl_count', 0),
-                        rating=meta_raw.get('rate_average_2dp', 0.0),
-                        release_date=meta_raw.get('release_date', ''),
-                        cover_url=meta_raw.get('mainCoverUrl', '')
-                    )
-                    root = orc.get_save_path(meta)
-                    hierarchy = orc.parse_hierarchy(tracks_raw, root, root)
-                    app.print_hierarchy(meta, hierarchy)
+                    for code in codes:
+                        work_code = normalize_work_code(code)
+                        if work_code:
+                            await list_rj(kernel, work_code)
                 finally:
                     await kernel.shutdown()
             
-            for code in args.rj_codes:
-                work_code = normalize_work_code(code)
-                if work_code:
-                    asyncio.run(list_rj(work_code))
+            asyncio.run(list_all(args.rj_codes))
             sys.exit(0)
             
         if args.test:
-            console.print("\n[yellow]Pinging all API mirrors...[/yellow]")
-            from rich.table import Table
-            results = asyncio.run(NetworkDiagnostics.get_all_latencies(app.config.proxy, getattr(app.config, 'dns', None)))
-            table = Table(show_header=True, header_style="bold blue")
-            table.add_column("Mirror")
-            table.add_column("Latency", justify="right")
-            table.add_column("Status")
-            table.add_column("Global (UptimeRobot)", justify="center")
-            
-            for mirror, latency, err, global_status in results:
-                if latency != float('inf'):
-                    ms = f"{latency*1000:.0f} ms"
-                    status = "[green]Online[/green]"
-                else:
-                    ms = "Error"
-                    status = f"[red]{err}[/red]"
-                
-                g_status = "-"
-                if global_status:
-                    if "UP" in global_status:
-                        g_status = f"[green]{global_status}[/green]"
-                    elif "DOWN" in global_status:
-                        g_status = f"[red]{global_status}[/red]"
-                    else:
-                        g_status = global_status
-
-                table.add_row(mirror, ms, status, g_status)
-            console.print(table)
+            app.print_mirror_latencies()
             sys.exit(0)
             
         if args.export:
@@ -260,18 +244,18 @@ def main() -> None:
                     console.print(f"[red]Failed to read batch file: {e}[/red]")
                     sys.exit(1)
             
-            added = 0
+            new_codes = []
             for code in set(codes):
                 work_code = normalize_work_code(code)
                 if not work_code:
                     continue
-                if app.db.get_work(work_code):
+                if app.db.has_work(work_code):
                     console.print(f"[yellow]Skipping {work_code}: Already in library.[/yellow]")
                     continue
-                app.db.queue_add(work_code)
-                added += 1
+                new_codes.append(work_code)
+            app.db.queue_add_many(new_codes)
             
-            if added > 0 or app.db.queue_get_pending():
+            if new_codes or app.db.queue_get_pending():
                 app.process_queue()
             else:
                 console.print("[yellow]No valid or new work codes found to download.[/yellow]")
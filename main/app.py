@@ -10,7 +10,7 @@ import subprocess
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import List, Dict, Tuple, Optional
 
 from rich import box
 from rich.panel import Panel
@@ -22,16 +22,17 @@ from rich.layout import Layout
 from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn, TimeRemainingColumn
 
-from main.constants import APP_NAME, APP_VERSION, GITHUB_REPO, RJ_PATTERN, CONFIG_FILE, DB_FILE, TKINTER_AVAILABLE, console, normalize_work_code, get_localized_tag_name
+from main.constants import APP_NAME, APP_VERSION, GITHUB_REPO, RJ_PATTERN, CONFIG_FILE, DB_FILE, TKINTER_AVAILABLE, console, format_mb, normalize_work_code, get_localized_tag_name
 if TKINTER_AVAILABLE:
     import tkinter as tk
     from tkinter import filedialog
 
-from main.models import WorkMetadata, TrackItem, SessionStats
+from main.models import WorkMetadata, TrackItem, SessionStats, iter_files
 from main.config import ConfigManager
 from main.db import LibraryVault
 from main.network import NetworkKernel, NetworkDiagnostics
 from main.orchestrator import Orchestrator
+from main.audio import CoverArt
 from main.progress import RichProgressReporter
 
 def get_source_code(meta_raw: dict, fallback: str) -> str:
@@ -42,6 +43,12 @@ def get_track_lookup_id(meta_raw: dict, fallback: str) -> str:
     """Tracks are keyed by ASMR.ONE's internal numeric work id."""
     return str(meta_raw.get('id') or fallback)
 
+def guess_track_lookup_id(work_code: str) -> Optional[str]:
+    """RJ works are usually keyed by their numeric part; other prefixes cannot be guessed."""
+    code = work_code.upper()
+    digits = code[2:] if code.startswith("RJ") else code
+    return str(int(digits)) if digits.isdecimal() else None
+
 def get_circle_name(meta_raw: dict) -> str:
     circle = meta_raw.get('circle')
     if isinstance(circle, dict) and circle.get('name'):
@@ -63,6 +70,9 @@ class Mainframe:
             console.print("[yellow]Warning: Bandwidth limit is set extremely low (< 100 KB/s). Downloads may timeout.[/yellow]")
         self.kernel = None
         self.orc = None
+        self._active_rj = None
+        self._active_targets: List[TrackItem] = []  # files of the work being downloaded
+        self._prefetched: Dict[str, asyncio.Task] = {}
     
     def clear(self) -> None:
         """Clear the console."""
@@ -113,16 +123,45 @@ class Mainframe:
                     add_nodes(item.children, branch)
                 else:
                     icon = "🎵" if item.type == 'audio' else "📄"
-                    parent_tree.add(f"{icon} {item.title} [dim]({item.size/1024/1024:.1f} MB)[/dim]")
+                    parent_tree.add(f"{icon} {item.title} [dim]({format_mb(item.size, 1)})[/dim]")
                     
         add_nodes(items, tree)
         console.print(tree)
 
+    def print_mirror_latencies(self) -> None:
+        """Ping every API mirror and print a latency/status table."""
+        console.print("\n[yellow]Pinging all API mirrors...[/yellow]")
+        results = asyncio.run(NetworkDiagnostics.get_all_latencies(self.config.proxy, getattr(self.config, 'dns', None)))
+        table = Table(show_header=True, header_style="bold blue")
+        table.add_column("Mirror")
+        table.add_column("Latency", justify="right")
+        table.add_column("Status")
+        table.add_column("Global (UptimeRobot)", justify="center")
+
+        for mirror, latency, err, global_status in results:
+            if latency != float('inf'):
+                ms = f"{latency*1000:.0f} ms"
+                status = "[green]Online[/green]"
+            else:
+                ms = "Error"
+                status = f"[red]{err}[/red]"
+
+            g_status = "-"
+            if global_status:
+                if "UP" in global_status:
+                    g_status = f"[green]{global_status}[/green]"
+                elif "DOWN" in global_status:
+                    g_status = f"[red]{global_status}[/red]"
+                else:
+                    g_status = global_status
+
+            table.add_row(mirror, ms, status, g_status)
+        console.print(table)
+
     def build_tree_selector(self, items: List[TrackItem]) -> List[TrackItem]:
         """Interactive tree builder for track selection."""
         tree = Tree("📂 [bold yellow]Root[/bold yellow]")
-        selection_map = {}
-        index_counter = [1]
+        numbered: List[TrackItem] = []  # files in display order; entry i-1 is shown as "i."
         
         def add_nodes(node_list: List[TrackItem], parent_tree: Tree) -> None:
             for item in node_list:
@@ -130,34 +169,21 @@ class Mainframe:
                     branch = parent_tree.add(f"📁 [bold]{item.title}[/bold]")
                     add_nodes(item.children, branch)
                 else:
-                    idx = index_counter[0]
+                    idx = len(numbered) + 1
                     icon = "🎵" if item.type == 'audio' else "📄"
                     
+                    # Sizes were cached by Orchestrator.scan_disk_state before selection
                     status = ""
-                    try:
-                        try:
-                            sz = item.save_path.stat().st_size
-                        except FileNotFoundError:
-                            sz = 0
-                            
-                        try:
-                            tmp_sz = item.save_path.with_name(item.save_path.name + ".tmp").stat().st_size
-                        except FileNotFoundError:
-                            tmp_sz = 0
-                            
-                        if sz == item.size:
-                            status = "[green]✅[/green] "
-                        elif tmp_sz > 0:
-                            status = "[yellow]⏳[/yellow] "
-                    except Exception:
-                        pass
+                    if item.disk_size == item.size:
+                        status = "[green]✅[/green] "
+                    elif item.tmp_size:
+                        status = "[yellow]⏳[/yellow] "
                         
                     parent_tree.add(
                         f"[bold cyan]{idx}.[/bold cyan] {status}{icon} {item.title} "
-                        f"[dim]({item.size/1024/1024:.1f} MB)[/dim]"
+                        f"[dim]({format_mb(item.size, 1)})[/dim]"
                     )
-                    selection_map[idx] = item
-                    index_counter[0] += 1
+                    numbered.append(item)
         
         add_nodes(items, tree)
         console.print(tree)
@@ -166,58 +192,110 @@ class Mainframe:
         choice = Prompt.ask("Selection", default="").strip()
         
         if not choice:
-            def get_all(nodes: List[TrackItem]) -> List[TrackItem]:
-                result = []
-                for n in nodes:
-                    if n.type != 'folder':
-                        result.append(n)
-                    result.extend(get_all(n.children))
-                return result
-            return get_all(items)
+            return list(iter_files(items))
         
-        selected = []
+        # One flag per index: ranges are set in a single slice, repeats collapse,
+        # and the result comes back in display order
+        picked = bytearray(len(numbered) + 1)
         for part in choice.split():
             try:
                 if '-' in part:
                     start_str, end_str = part.split('-', 1)
-                    start = int(start_str.strip())
-                    end = int(end_str.strip())
-                    for i in range(start, end + 1):
-                        if i in selection_map:
-                            selected.append(selection_map[i])
+                    start = max(int(start_str.strip()), 1)
+                    end = min(int(end_str.strip()), len(numbered))
+                    if start <= end:
+                        picked[start:end + 1] = b'\x01' * (end + 1 - start)
                 else:
                     idx = int(part.strip())
-                    if idx in selection_map:
-                        selected.append(selection_map[idx])
-            except (ValueError, KeyError):
+                    if 1 <= idx <= len(numbered):
+                        picked[idx] = 1
+            except ValueError:
                 console.print(f"[red]Invalid selection: {part}[/red]")
         
-        return selected
+        return [item for item, flag in zip(numbered, picked[1:]) if flag]
     
 
-    async def _run_job_safe(self, rj_id: str) -> int:
-        """Helper to run a job and safely cleanup the event loop resources."""
+    async def fetch_work(self, work_code: str) -> Tuple[Optional[dict], Optional[list]]:
+        """Fetch the raw workInfo and track list for a work code."""
+        # Request the likely track list in workInfo's rate-limit slot; it is only used if the ids agree
+        guess = guess_track_lookup_id(work_code)
+        speculative = None
+        try:
+            if guess:
+                meta_raw, speculative = await self.kernel.fetch_pair(
+                    f"/api/workInfo/{work_code}", f"/api/tracks/{guess}?v=2"
+                )
+            else:
+                meta_raw = await self.kernel.fetch(f"/api/workInfo/{work_code}")
+            if not meta_raw:
+                return None, None
+            track_lookup_id = get_track_lookup_id(meta_raw, work_code)
+            if speculative is not None and track_lookup_id == guess:
+                return meta_raw, await speculative
+            tracks_raw = await self.kernel.fetch(f"/api/tracks/{track_lookup_id}?v=2")
+            return meta_raw, tracks_raw
+        finally:
+            if speculative is not None and not speculative.done():
+                speculative.cancel()
+
+    async def _drain_queue(self, failed_rjs: List[str]) -> None:
+        """Run every pending job on one event loop so all works share a single HTTP session."""
         self.kernel = NetworkKernel(self.config)
-        self.orc = Orchestrator(self.kernel, self.config, self.db)
+        self._prefetched = {}
         try:
-            await self.execute_job(rj_id)
-            return self.orc.stats.failed
+            while True:
+                pending = self.db.queue_get_pending()
+                if not pending:
+                    console.print("[green]Queue is empty or all downloads completed.[/green]")
+                    await asyncio.sleep(1.5)
+                    break
+
+                # Start the metadata fetch for the next works now so it overlaps
+                # with the downloads of the current one. Selection prompts still
+                # run one work at a time inside execute_job.
+                for row in pending[:1 + self.config.prefetch_works]:
+                    code = normalize_work_code(row['rj_id']) or row['rj_id']
+                    if code not in self._prefetched:
+                        self._prefetched[code] = asyncio.create_task(self.fetch_work(code))
+
+                rj = pending[0]['rj_id']
+                self._active_rj = rj
+                try:
+                    self.db.queue_update_status(rj, 'active')
+                    self.orc = Orchestrator(self.kernel, self.config, self.db)
+                    await self.execute_job(rj)
+                    self.db.queue_remove(rj)
+                    if self.orc.stats.failed > 0:
+                        failed_rjs.append(rj)
+                except Exception as e:
+                    console.print(f"\n[red]Error processing {rj}: {e}[/red]")
+                    logging.exception(f"Error processing {rj}: {e}")
+                    # Remove from queue so it doesn't block future runs as a permanent 'error' row
+                    self.db.queue_remove(rj)
+                    failed_rjs.append(rj)
+                    await asyncio.sleep(1.5)
+                    break
+                self._active_rj = None
+                self._active_targets = []
         finally:
-            if self.kernel:
-                await self.kernel.shutdown()
+            for task in self._prefetched.values():
+                task.cancel()
+            await asyncio.gather(*self._prefetched.values(), return_exceptions=True)
+            self._prefetched = {}
+            await self.kernel.shutdown()
 
     async def execute_job(self, rj_id: str) -> int:
         """Execute a download job for a specific work code."""
         work_code = normalize_work_code(rj_id) or rj_id
         self.orc.log_ui(f"Fetching metadata for {work_code}...")
         
-        meta_raw = await self.kernel.fetch(f"/api/workInfo/{work_code}")
+        prefetched = self._prefetched.pop(work_code, None)
+        meta_raw, tracks_raw = await (prefetched or self.fetch_work(work_code))
         if not meta_raw:
             self.orc.log_ui(f"[red]Failed to fetch metadata for {work_code}[/red]")
             return 1
 
         source_code = get_source_code(meta_raw, work_code)
-        track_lookup_id = get_track_lookup_id(meta_raw, work_code)
         
         meta = WorkMetadata(
             rj_id=source_code,
@@ -233,23 +311,15 @@ class Mainframe:
             cover_url=meta_raw.get('mainCoverUrl', '')
         )
         
-        tracks_raw = await self.kernel.fetch(f"/api/tracks/{track_lookup_id}?v=2")
         if not tracks_raw:
             self.orc.log_ui(f"[red]Failed to fetch tracks for {source_code}[/red]")
             return 1
         
         root_path = self.orc.get_save_path(meta)
         hierarchy = self.orc.parse_hierarchy(tracks_raw, root_path, root_path)
+        all_tracks = list(iter_files(hierarchy))
+        await asyncio.to_thread(self.orc.scan_disk_state, all_tracks)
 
-        def flatten(nodes: List[TrackItem]) -> List[TrackItem]:
-            """Flatten a hierarchy of TrackItems into a flat list of files."""
-            result = []
-            for n in nodes:
-                if n.type != 'folder':
-                    result.append(n)
-                result.extend(flatten(n.children))
-            return result
-        
         selection_file = Path(".cache") / f"{source_code}.json"
         
         targets = None
@@ -258,7 +328,6 @@ class Mainframe:
                 with open(selection_file, 'r', encoding='utf-8') as f:
                     saved_paths = set(json.load(f))
                     
-                all_tracks = flatten(hierarchy)
                 saved_targets = [t for t in all_tracks if str(t.save_path.relative_to(root_path).as_posix()) in saved_paths]
                 
                 if saved_targets:
@@ -276,7 +345,7 @@ class Mainframe:
 
         if not targets:
             if len(self.db.queue_get_pending()) > 1 or self.auto_all:
-                targets = flatten(hierarchy)
+                targets = all_tracks
             else:
                 self.clear()
                 self.draw_header()
@@ -299,8 +368,10 @@ class Mainframe:
                     try:
                         selection_file.parent.mkdir(parents=True, exist_ok=True)
                         rel_paths = [str(t.save_path.relative_to(root_path).as_posix()) for t in targets]
-                        with open(selection_file, 'w', encoding='utf-8') as f:
-                            json.dump(rel_paths, f)
+                        payload = json.dumps(rel_paths)
+                        # Leave an identical selection untouched so the file is not rewritten every run
+                        if not selection_file.exists() or selection_file.read_text(encoding='utf-8') != payload:
+                            selection_file.write_text(payload, encoding='utf-8')
                     except Exception:
                         pass
         
@@ -310,25 +381,21 @@ class Mainframe:
             
         if self.dry_run:
             total_sz = sum(t.size for t in targets)
-            console.print(f"\n[bold cyan][DRY RUN] Would download {len(targets)} files ({total_sz/1024/1024:.2f} MB) for {source_code}[/bold cyan]")
+            console.print(f"\n[bold cyan][DRY RUN] Would download {len(targets)} files ({format_mb(total_sz)}) for {source_code}[/bold cyan]")
             return 0
+
+        self._active_targets = targets
             
         self.clear()
         self.draw_header()
         
-        cover_path = None
+        cover = None
         if meta.cover_url:
             root_path.mkdir(parents=True, exist_ok=True)
-            target_cover = root_path / "cover.jpg"
-            try:
-                async with await self.kernel.stream(meta.cover_url) as resp:
-                    if resp.status == 200:
-                        data = await resp.read()
-                        with open(target_cover, 'wb') as f:
-                            f.write(data)
-                        cover_path = target_cover
-            except Exception:
-                cover_path = None
+            cover_path = await self.orc.download_cover(meta.cover_url, root_path)
+            if cover_path and self.config.tag_audio:
+                # Read once here; every tagged file of the work embeds the same frames
+                cover = await asyncio.to_thread(CoverArt.load, cover_path)
         
         layout = Layout()
         layout.split_column(
@@ -347,14 +414,9 @@ class Mainframe:
         )
         
         def get_curr_size(t: TrackItem) -> int:
-            try:
-                return t.save_path.stat().st_size
-            except FileNotFoundError:
-                pass
-            try:
-                return t.save_path.with_name(t.save_path.name + ".tmp").stat().st_size
-            except FileNotFoundError:
-                return 0
+            if t.disk_size is not None:
+                return t.disk_size
+            return t.tmp_size or 0
 
         total_bytes = sum(t.size for t in targets)
         curr_bytes = sum(get_curr_size(t) for t in targets)
@@ -367,36 +429,44 @@ class Mainframe:
         
         self.orc.stats = SessionStats()
         
-        with Live(layout, refresh_per_second=10, console=console):
+        with Live(layout, refresh_per_second=10, console=console) as live:
             layout["prog"].update(Panel(prog, border_style="blue"))
             
+            def draw_logs() -> None:
+                log_text = "\n".join(self.orc.logs[-5:])
+                layout["logs"].update(Panel(log_text, title="Log", border_style="dim"))
+
             async def updater():
-                while not prog.finished:
-                    log_text = "\n".join(self.orc.logs[-5:])
-                    layout["logs"].update(Panel(log_text, title="Log", border_style="dim"))
-                    await asyncio.sleep(0.5)
+                # Redraw the log panel only when log_ui() reports a new line
+                while True:
+                    draw_logs()
+                    await self.orc.log_event.wait()
+                    self.orc.log_event.clear()
             
             update_task = asyncio.create_task(updater())
             
             reporter = RichProgressReporter(prog)
-            coros = [
-                self.orc.download_file(t, meta, reporter, main_task, cover_path) 
-                for t in targets
-            ]
-            await asyncio.gather(*coros)
-            
-            await asyncio.sleep(1.0)
+            await self.orc.download_all(targets, meta, reporter, main_task, cover)
+
+            # Paint the final state right away instead of lingering for the next refresh tick
             update_task.cancel()
+            draw_logs()
+            live.refresh()
         
         def get_final_size(t: TrackItem) -> int:
             try:
                 return t.save_path.stat().st_size
             except FileNotFoundError:
                 return 0
-                
-        final_size = sum(get_final_size(t) for t in targets)
+
+        def finish_on_disk() -> int:
+            # The size sweep and playlist walk block on the filesystem, which would
+            # stall the next work's metadata prefetch if run on the event loop
+            self.orc.generate_m3u_playlist(root_path, meta)
+            return sum(get_final_size(t) for t in targets)
+
+        final_size = await asyncio.to_thread(finish_on_disk)
         self.db.register(meta, final_size, root_path)
-        self.orc.generate_m3u_playlist(root_path, meta)
         try:
             if selection_file.exists():
                 selection_file.unlink()
@@ -412,13 +482,13 @@ class Mainframe:
         sum_tab.add_row("Success", str(self.orc.stats.success))
         
         elapsed_sec = time.time() - self.orc.stats.start_time
-        speed = (self.orc.stats.bytes_downloaded / 1024**2) / elapsed_sec if elapsed_sec > 0 else 0
+        speed = self.orc.stats.bytes_downloaded / elapsed_sec if elapsed_sec > 0 else 0
         summary_data = [
             ("Failed", self.orc.stats.failed, "red"),
             ("Skipped", self.orc.stats.skipped, "yellow"),
             ("Time Elapsed", f"{elapsed_sec:.1f}s", "cyan"),
-            ("Avg Speed", f"{speed:.2f} MB/s", "cyan"),
-            ("Total Data", f"{self.orc.stats.bytes_downloaded / 1024**2:.2f} MB", "cyan")
+            ("Avg Speed", f"{format_mb(speed)}/s", "cyan"),
+            ("Total Data", format_mb(self.orc.stats.bytes_downloaded), "cyan")
         ]
         
         for label, value, color in summary_data:
@@ -496,8 +566,7 @@ class Mainframe:
                     selected_codes.append(work_map[token])
 
         if selected_codes:
-            for code in list(dict.fromkeys(selected_codes)):
-                self.db.queue_add(code)
+            self.db.queue_add_many(list(dict.fromkeys(selected_codes)))
             console.print(f"[green]Added {len(selected_codes)} work(s) to the queue![/green]")
             time.sleep(1)
             if Confirm.ask("Process queue now?"):
@@ -589,8 +658,7 @@ class Mainframe:
                             continue
                     final_codes.append(code)
                 
-                for code in final_codes:
-                    self.db.queue_add(code)
+                self.db.queue_add_many(final_codes)
                 console.print(f"[green]Added {len(final_codes)} works to the download queue.[/green]")
                 
                 if Confirm.ask("Process queue now?"):
@@ -623,8 +691,7 @@ class Mainframe:
                                 continue
                         final_codes.append(code)
 
-                    for code in final_codes:
-                        self.db.queue_add(code)
+                    self.db.queue_add_many(final_codes)
                     console.print(f"[green]Successfully loaded {len(final_codes)} work codes into the queue.[/green]")
                     time.sleep(1)
                     
@@ -692,6 +759,7 @@ class Mainframe:
                 settings_info = f"""
 Directory: {self.config.output_dir}
 Concurrent Downloads: {self.config.max_concurrent}
+Work Prefetch: {self.config.prefetch_works}
 Bandwidth Limit: {self.config.bandwidth_limit_mbps if self.config.bandwidth_limit_mbps > 0 else 'Unlimited'} MB/s
 Proxy: {self.config.proxy or 'None'}
 Mirror: {self.config.mirror}
@@ -745,6 +813,10 @@ Timeout: {self.config.timeout}s
                     if Confirm.ask(f"Change concurrent downloads (currently: {self.config.max_concurrent})?"):
                         new_max = IntPrompt.ask("Number (1-10)", default=self.config.max_concurrent)
                         self.config.max_concurrent = max(1, min(10, new_max))
+
+                    if Confirm.ask(f"Change work prefetch (currently: {self.config.prefetch_works})?"):
+                        new_prefetch = IntPrompt.ask("Queued works to fetch ahead (0-5)", default=self.config.prefetch_works)
+                        self.config.prefetch_works = max(0, min(5, new_prefetch))
                         
                     if Confirm.ask(f"Change bandwidth limit (currently: {self.config.bandwidth_limit_mbps} MB/s)?"):
                         new_bw = Prompt.ask("Limit in MB/s (0 for unlimited)", default=str(self.config.bandwidth_limit_mbps))
@@ -791,8 +863,7 @@ Timeout: {self.config.timeout}s
         stats.add_row("[cyan]Library Size:[/cyan]", f"[green]{sz/1024**3:.2f} GB[/green]")
         stats.add_row("[cyan]Queue Length:[/cyan]", f"[green]{len(self.db.queue_get_pending())}[/green]")
         if cnt > 0:
-            avg_size = sz / cnt / 1024**2
-            stats.add_row("[cyan]Average Work Size:[/cyan]", f"[green]{avg_size:.1f} MB[/green]")
+            stats.add_row("[cyan]Average Work Size:[/cyan]", f"[green]{format_mb(sz / cnt, 1)}[/green]")
         
         console.print(Panel(stats, border_style="green"))
         
@@ -808,46 +879,33 @@ Timeout: {self.config.timeout}s
             console.print("Press [yellow]Ctrl+C[/yellow] during a download to safely pause and return to menu.\n")
             
             failed_rjs = []
-            
-            while True:
-                pending = self.db.queue_get_pending()
-                if not pending:
-                    console.print("[green]Queue is empty or all downloads completed.[/green]")
-                    time.sleep(1.5)
-                    break
-                    
-                rj = pending[0]['rj_id']
-                try:
-                    self.db.queue_update_status(rj, 'active')
-                    failed = asyncio.run(self._run_job_safe(rj))
-                    self.db.queue_remove(rj)
-                    if failed and failed > 0:
-                        failed_rjs.append(rj)
-                except KeyboardInterrupt:
-                    console.print(f"\n[yellow]Download paused for {rj}. State saved to database.[/yellow]")
-                    self.db.queue_update_status(rj, 'pending')
-                    if Confirm.ask("\n[yellow]Do you want to clean up in-progress .tmp files for this download?[/yellow]", default=False):
-                        cleaned = 0
-                        for path in self.config.output_dir.rglob("*.tmp"):
-                            if str(rj) in str(path) and path.is_file():
+            self._active_rj = None
+            self._active_targets = []
+
+            try:
+                asyncio.run(self._drain_queue(failed_rjs))
+            except KeyboardInterrupt:
+                rj = self._active_rj
+                if rj is None:
+                    return
+                console.print(f"\n[yellow]Download paused for {rj}. State saved to database.[/yellow]")
+                self.db.queue_update_status(rj, 'pending')
+                if Confirm.ask("\n[yellow]Do you want to clean up in-progress .tmp files for this download?[/yellow]", default=False):
+                    # Only the paused work's part files, instead of walking the whole library
+                    cleaned = 0
+                    for track in self._active_targets:
+                        for suffix in (".tmp", ".seg.tmp", ".seg.ranges.tmp"):
+                            path = Path(str(track.save_path) + suffix)
+                            if path.is_file():
                                 path.unlink()
                                 cleaned += 1
-                        console.print(f"[green]Cleaned up {cleaned} .tmp files.[/green]")
-                    time.sleep(1.5)
-                    return
-                except Exception as e:
-                    console.print(f"\n[red]Error processing {rj}: {e}[/red]")
-                    logging.exception(f"Error processing {rj}: {e}")
-                    # Remove from queue so it doesn't block future runs as a permanent 'error' row
-                    self.db.queue_remove(rj)
-                    failed_rjs.append(rj)
-                    time.sleep(1.5)
-                    break
+                    console.print(f"[green]Cleaned up {cleaned} .tmp files.[/green]")
+                time.sleep(1.5)
+                return
                     
             if failed_rjs:
                 if Confirm.ask(f"\n[yellow]{len(failed_rjs)} work codes had failed downloads. Retry them now?[/yellow]"):
-                    for rj in failed_rjs:
-                        self.db.queue_add(rj)
+                    self.db.queue_add_many(failed_rjs)
                     continue
             
             break
@@ -906,8 +964,7 @@ Timeout: {self.config.timeout}s
                         if not Confirm.ask(f"[yellow]{c} is already in your library (downloaded on {date}).[/yellow] Re-download anyway?"):
                             continue
                     final_codes.append(c)
-                for c in final_codes:
-                    self.db.queue_add(c)
+                self.db.queue_add_many(final_codes)
             elif choice == "2":
                 rj = Prompt.ask("Enter Work Code to remove").strip()
                 work_code = normalize_work_code(rj)
@@ -1010,41 +1067,14 @@ Timeout: {self.config.timeout}s
                 if not files_to_delete:
                     console.print("[green]✓ No cache files found. Everything is clean![/green]")
                 else:
-                    mb_freed = bytes_freed / 1024 / 1024
-                    if Confirm.ask(f"[yellow]Found {len(files_to_delete)} temp files ({mb_freed:.2f} MB). Delete?[/yellow]", default=True):
+                    if Confirm.ask(f"[yellow]Found {len(files_to_delete)} temp files ({format_mb(bytes_freed)}). Delete?[/yellow]", default=True):
                         for path in files_to_delete:
                             path.unlink()
                         console.print(f"[green]✓ Deleted {len(files_to_delete)} files.[/green]")
                 
                 Prompt.ask("\n[dim]Press Enter to continue...[/dim]")
             elif choice == "4":
-                console.print("\n[yellow]Pinging all API mirrors...[/yellow]")
-                results = asyncio.run(NetworkDiagnostics.get_all_latencies(self.config.proxy, getattr(self.config, 'dns', None)))
-                table = Table(show_header=True, header_style="bold blue")
-                table.add_column("Mirror")
-                table.add_column("Latency", justify="right")
-                table.add_column("Status")
-                table.add_column("Global (UptimeRobot)", justify="center")
-                
-                for mirror, latency, err, global_status in results:
-                    if latency != float('inf'):
-                        ms = f"{latency*1000:.0f} ms"
-                        status = "[green]Online[/green]"
-                    else:
-                        ms = "Error"
-                        status = f"[red]{err}[/red]"
-                    
-                    g_status = "-"
-                    if global_status:
-                        if "UP" in global_status:
-                            g_status = f"[green]{global_status}[/green]"
-                        elif "DOWN" in global_status:
-                            g_status = f"[red]{global_status}[/red]"
-                        else:
-                            g_status = global_status
-
-                    table.add_row(mirror, ms, status, g_status)
-                console.print(table)
+                self.print_mirror_latencies()
                 Prompt.ask("\n[dim]Press Enter to continue...[/dim]")
             elif choice == "5":
                 from main.updater import GitHubUpdater
@@ -12,10 +12,31 @@ from mutagen.mp3 import MP3
 
 from main.models import WorkMetadata
 
+class CoverArt:
+    """Cover image loaded once per work, with tag frames shared by every tagged file."""
+    __slots__ = ("apic", "picture")
+
+    def __init__(self, data: bytes, mime: str):
+        self.apic = APIC(encoding=3, mime=mime, type=3, desc='Cover', data=data)
+        self.picture = Picture()
+        self.picture.type = 3
+        self.picture.mime = mime
+        self.picture.data = data
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["CoverArt"]:
+        """Read a cover image from disk, returning None if it cannot be read."""
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            logging.debug(f"Failed to read cover {path}: {e}")
+            return None
+        return cls(data, mimetypes.guess_type(str(path))[0] or 'image/jpeg')
+
 class AudioProcessor:
     """Handles audio file tagging with metadata."""
     @staticmethod
-    def apply_tags(path: Path, meta: WorkMetadata, cover: Optional[Path]) -> None:
+    def apply_tags(path: Path, meta: WorkMetadata, cover: Optional[CoverArt]) -> None:
         """Apply metadata tags to audio file."""
         if not path.exists():
             return
@@ -32,7 +53,7 @@ class AudioProcessor:
             logging.exception(f"Failed to tag {path}: {e}")
 
     @staticmethod
-    def _tag_mp3(path: Path, meta: WorkMetadata, cover: Optional[Path]) -> None:
+    def _tag_mp3(path: Path, meta: WorkMetadata, cover: Optional[CoverArt]) -> None:
         """Tag MP3 file with metadata."""
         try:
             tags = EasyID3(str(path))
@@ -45,24 +66,16 @@ class AudioProcessor:
         tags['organization'] = meta.circle
         tags.save(str(path))
         
-        if cover and cover.exists():
+        if cover:
             try:
-                mime = mimetypes.guess_type(str(cover))[0] or 'image/jpeg'
                 audio = MP3(str(path), ID3=ID3)
-                with open(cover, 'rb') as c:
-                    audio.tags.add(APIC(
-                        encoding=3,
-                        mime=mime,
-                        type=3,
-                        desc='Cover',
-                        data=c.read()
-                    ))
+                audio.tags.add(cover.apic)
                 audio.save()
             except Exception:
                 pass
 
     @staticmethod
-    def _tag_ogg(path: Path, meta: WorkMetadata, cover: Optional[Path]) -> None:
+    def _tag_ogg(path: Path, meta: WorkMetadata, cover: Optional[CoverArt]) -> None:
         """Tag OGG file with metadata."""
         try:
             tags = OggVorbis(str(path))
@@ -76,7 +89,7 @@ class AudioProcessor:
         tags.save(str(path))
 
     @staticmethod
-    def _tag_flac(path: Path, meta: WorkMetadata, cover: Optional[Path]) -> None:
+    def _tag_flac(path: Path, meta: WorkMetadata, cover: Optional[CoverArt]) -> None:
         """Tag FLAC file with metadata."""
         try:
             audio = FLAC(str(path))
@@ -85,16 +98,10 @@ class AudioProcessor:
             audio['album'] = meta.title
             audio['organization'] = meta.circle
             
-            if cover and cover.exists():
+            if cover:
                 try:
-                    mime = mimetypes.guess_type(str(cover))[0] or 'image/jpeg'
-                    picture = Picture()
-                    picture.type = 3
-                    picture.mime = mime
-                    with open(cover, 'rb') as c:
-                        picture.data = c.read()
                     audio.clear_pictures()
-                    audio.add_picture(picture)
+                    audio.add_picture(cover.picture)
                 except Exception as e:
                     logging.debug(f"Failed to attach cover to FLAC {path}: {e}")
             
@@ -9,6 +9,7 @@ from main.constants import HOSTNAME_MIRRORS, CONFIG_FILE
 class ConfigSchema(BaseModel):
     output_dir: str = Field(default="Downloads")
     max_concurrent: int = Field(default=3, gt=0, le=20)
+    prefetch_works: int = Field(default=1, ge=0, le=5)
     proxy: Optional[str] = Field(default=None)
     mirror: str = Field(default=HOSTNAME_MIRRORS[0])
     tag_audio: bool = Field(default=True)
@@ -30,6 +31,7 @@ class ConfigManager:
             data = ConfigSchema()
         self.output_dir = Path(data.output_dir)
         self.max_concurrent = data.max_concurrent
+        self.prefetch_works = data.prefetch_works
         self.proxy = data.proxy
         self.mirror = data.mirror
         self.tag_audio = data.tag_audio
@@ -74,6 +76,7 @@ class ConfigManager:
         data = {
             "output_dir": str(self.output_dir),
             "max_concurrent": self.max_concurrent,
+            "prefetch_works": self.prefetch_works,
             "proxy": self.proxy,
             "mirror": self.mirror,
             "tag_audio": self.tag_audio,
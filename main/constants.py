@@ -1,6 +1,8 @@
 import re
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, List, Any
 from rich.console import Console
@@ -13,17 +15,32 @@ APP_NAME = "ASMR.ONE DOWNLOADER"
 WORK_CODE_PATTERN = re.compile(r"(?P<code>(?:(?P<prefix>RJ|VJ))?(?P<id>[\d]{6,}))", re.IGNORECASE)
 RJ_PATTERN = WORK_CODE_PATTERN
 CHUNK_SIZE = 1048576  # 1MB chunks for smoother throttling and progress
+WRITE_BUFFER_SIZE = 4 * CHUNK_SIZE  # received chunks are batched into writes of this size
+SEGMENT_MIN_SIZE = 32 * 1024 * 1024  # files at least this large are fetched as parallel byte ranges
+SEGMENT_COUNT = 4  # byte ranges (connections) per segmented file
 CONFIG_FILE = Path("config.json")
 DB_FILE = Path("history.db")
 LOG_FILE = Path("singularity.log")
 
 def normalize_work_code(value: str) -> Optional[str]:
     """Return a normalized DLsite work code, preserving RJ/VJ prefixes when present."""
+    # Plain codes like "RJ01304763" or "123456" skip the regex; free text falls through to it
+    code = value.strip().upper()
+    digits = code[2:] if code[:2] in ("RJ", "VJ") else code
+    if len(digits) >= 6 and digits.isdecimal():
+        return code
+
     match = WORK_CODE_PATTERN.search(value)
     if not match:
         return None
     return match.group("code").upper()
 
+_INV_MB = 1.0 / 1048576
+
+def format_mb(size: int, precision: int = 2) -> str:
+    """Format a byte count as megabytes for display."""
+    return f"{size * _INV_MB:.{precision}f} MB"
+
 def get_localized_tag_name(tag: Any, priority_list: Optional[List[str]] = None) -> str:
     """Extract tag name according to language priority list (e.g. ['ja-jp', 'en-us', 'zh-cn'])."""
     if isinstance(tag, str):
@@ -80,11 +97,27 @@ def init_logging() -> None:
         )
         log_handler.setFormatter(log_formatter)
 
+        # Records are handed to a listener thread that owns the file, so log
+        # calls made from download coroutines never block on disk writes.
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, log_handler)
+        listener.start()
+
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.INFO)
         for h in root_logger.handlers[:]:
             root_logger.removeHandler(h)
-        root_logger.addHandler(log_handler)
+        root_logger.addHandler(queue_handler)
+
+        def stop_listener() -> None:
+            # Records emitted after exit starts (e.g. aiohttp's unclosed-session
+            # warnings during GC) go straight to the file instead of a dead queue
+            root_logger.removeHandler(queue_handler)
+            listener.stop()
+            root_logger.addHandler(log_handler)
+
+        atexit.register(stop_listener)
     except Exception:
         pass
 
@@ -2,7 +2,7 @@ import sqlite3
 import time
 from pathlib import Path
 from typing import List, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from main.constants import DB_FILE
 from main.models import WorkMetadata
@@ -15,11 +15,17 @@ class LibraryVault:
         self._summary_cache_time = 0.0
         self._summary_cache = (0, 0)
         self._init_schema()
+        # Library membership is checked for every pasted/queued code; keep it in memory
+        self._work_ids = {row[0] for row in self.conn.execute("SELECT rj_id FROM works")}
 
     def _init_schema(self) -> None:
         """Initialize database schema."""
         with self.conn:
             self.conn.execute("PRAGMA journal_mode=WAL;")
+            # WAL only needs to sync at checkpoints; commits stay durable against app crashes
+            self.conn.execute("PRAGMA synchronous=NORMAL;")
+            self.conn.execute("PRAGMA temp_store=MEMORY;")
+            self.conn.execute("PRAGMA cache_size=-20000;")
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS works (
                     rj_id TEXT PRIMARY KEY,
@@ -78,12 +84,19 @@ class LibraryVault:
                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
                 (meta.rj_id, meta.title, meta.circle, datetime.now(), size, str(path), getattr(meta, 'cover_url', ''))
             )
+        self._work_ids.add(meta.rj_id)
         self._summary_cache_time = 0  # invalidate cache so draw_header() reflects new work
 
     def get_work(self, rj_id: str) -> Optional[sqlite3.Row]:
         """Get a work from the library by RJ code."""
+        if rj_id not in self._work_ids:
+            return None
         return self.conn.execute("SELECT * FROM works WHERE rj_id = ?", (rj_id,)).fetchone()
 
+    def has_work(self, rj_id: str) -> bool:
+        """Check whether an RJ code is already in the library."""
+        return rj_id in self._work_ids
+
     def get_summary(self) -> Tuple[int, int]:
         """Get total works and total library size."""
         if hasattr(self, '_summary_cache_time') and time.time() - self._summary_cache_time < 30:
@@ -116,6 +129,19 @@ class LibraryVault:
                 (rj_id, priority, datetime.now())
             )
 
+    def queue_add_many(self, rj_ids: List[str], priority: int = 0) -> None:
+        """Add several RJ codes to the download queue in a single transaction."""
+        now = datetime.now()
+        # Offset timestamps so the queue keeps the given order
+        rows = [(rj_id, priority, now + timedelta(microseconds=i)) for i, rj_id in enumerate(rj_ids)]
+        with self.conn:
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO download_queue 
+                   (rj_id, priority, status, added_at) 
+                   VALUES (?, ?, 'pending', ?)""",
+                rows
+            )
+
     def queue_remove(self, rj_id: str) -> None:
         """Remove an RJ code from the download queue."""
         with self.conn:
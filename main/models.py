@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 from dataclasses import dataclass, field
 
 @dataclass
@@ -19,7 +19,7 @@ class WorkMetadata:
     cover_url: str
     total_size: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class TrackItem:
     """Represents a track or folder in the download hierarchy."""
     id: str
@@ -30,6 +30,21 @@ class TrackItem:
     save_path: Path
     level: int = 0
     children: List['TrackItem'] = field(default_factory=list)
+    disk_size: Optional[int] = None  # finished file size on disk, None when absent
+    tmp_size: Optional[int] = None  # bytes already in a resumable .tmp or .seg.tmp, None when absent
+
+def iter_files(nodes: List[TrackItem]) -> Iterator[TrackItem]:
+    """Yield the files of a track hierarchy in depth-first order, skipping folders."""
+    stack = [iter(nodes)]
+    while stack:
+        for node in stack[-1]:
+            if node.type != 'folder':
+                yield node
+            if node.children:
+                stack.append(iter(node.children))
+                break
+        else:
+            stack.pop()
 
 @dataclass
 class SessionStats:
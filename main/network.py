@@ -6,22 +6,37 @@ import asyncio
 import logging
 from typing import Optional, Tuple, List
 import aiohttp
+import yarl
 from aiohttp import ClientTimeout
 
-from main.constants import USER_AGENTS, HOSTNAME_MIRRORS, console
+from main.constants import USER_AGENTS, HOSTNAME_MIRRORS, SEGMENT_COUNT, console
 from main.config import ConfigManager
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_API_HOSTS = frozenset(yarl.URL(m).host for m in HOSTNAME_MIRRORS)
+
+
 class NetworkKernel:
     """Handles network operations and API communication."""
     def __init__(self, config: ConfigManager):
         self.config = config
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = None  # file transfers
+        self.api_session: Optional[aiohttp.ClientSession] = None  # JSON API calls
+        self._http_proxy: Optional[str] = None  # per-request proxy; socks proxies live in the connector
         self._last_req = 0
         self._rate_limit_lock = asyncio.Lock()
 
     async def boot(self) -> None:
-        """Initialize HTTP session."""
+        """Initialize HTTP sessions."""
         if self.session is None or self.session.closed:
+            proxy = self.config.proxy
+            self._http_proxy = proxy if proxy and not proxy.startswith("socks") else None
+
             headers = {
                 "User-Agent": random.choice(USER_AGENTS),
                 "Referer": "https://asmr.one/",
@@ -33,53 +48,91 @@ class NetworkKernel:
                 connect=self.config.timeout, 
                 sock_read=self.config.timeout
             )
+
+            if getattr(self.config, 'dns', None) and self.config.dns.lower() == "auto":
+                fastest_dns = await NetworkDiagnostics.scan_best_dns(self.config.proxy)
+                if fastest_dns:
+                    self.config.dns = fastest_dns # Save it for the session
             
-            connector = None
-            if self.config.proxy and self.config.proxy.startswith("socks"):
-                from aiohttp_socks import ProxyConnector
-                connector = ProxyConnector.from_url(self.config.proxy)
-            elif getattr(self.config, 'dns', None):
-                dns_ip = self.config.dns
-                if dns_ip.lower() == "auto":
-                    fastest_dns = await NetworkDiagnostics.scan_best_dns(self.config.proxy)
-                    if fastest_dns:
-                        dns_ip = fastest_dns
-                        self.config.dns = fastest_dns # Save it for the session
-                    else:
-                        dns_ip = None # fallback to threaded resolver if scan fails
-                        
-                if dns_ip and dns_ip.lower() != "auto":
-                    from aiohttp.resolver import AsyncResolver
-                    resolver = AsyncResolver(nameservers=[dns_ip])
-                    connector = aiohttp.TCPConnector(resolver=resolver)
-                else:
-                    from aiohttp.resolver import ThreadedResolver
-                    connector = aiohttp.TCPConnector(resolver=ThreadedResolver())
-            else:
-                # Always use ThreadedResolver (system DNS via socket API).
-                # This is critical on Windows with VPNs: aiodns (the aiohttp
-                # default) queries DNS directly and bypasses the VPN tunnel,
-                # causing timeouts. ThreadedResolver calls getaddrinfo() which
-                # respects the OS routing table and VPN adapter.
-                from aiohttp.resolver import ThreadedResolver
-                connector = aiohttp.TCPConnector(resolver=ThreadedResolver())
-                
+            # One pooled connector for the whole kernel lifetime so keep-alive
+            # connections and cached DNS answers are reused across works.
+            # Large files open SEGMENT_COUNT ranged connections each.
             self.session = aiohttp.ClientSession(
                 headers=headers, 
                 timeout=timeout,
-                connector=connector
+                connector=self._build_connector(
+                    limit=self.config.max_concurrent * (SEGMENT_COUNT + 1),
+                    limit_per_host=self.config.max_concurrent * SEGMENT_COUNT
+                )
+            )
+            # Metadata and search calls get their own small pool so they never queue
+            # behind saturated file transfers. aiohttp advertises gzip/deflate and
+            # decodes the compressed JSON bodies transparently. Each rate-limit slot
+            # carries at most a workInfo/tracks pair (fetch_pair), and every queued
+            # work being fetched (the current one plus prefetch_works) can have its
+            # pair in flight at once, so the pool holds two connections per work
+            # and the current work never waits behind prefetch traffic.
+            api_per_host = 2 * (1 + self.config.prefetch_works)
+            self.api_session = aiohttp.ClientSession(
+                headers={**headers, "Accept": "application/json"},
+                timeout=timeout,
+                connector=self._build_connector(limit=2 * api_per_host, limit_per_host=api_per_host)
             )
 
+    def _build_connector(self, limit: int, limit_per_host: int) -> aiohttp.BaseConnector:
+        """Create a connector honouring the proxy and DNS settings."""
+        pool = dict(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,  # outlive the pause between files and works, not just back-to-back requests
+            enable_cleanup_closed=True
+        )
+
+        if self.config.proxy and self.config.proxy.startswith("socks"):
+            from aiohttp_socks import ProxyConnector
+            return ProxyConnector.from_url(self.config.proxy, **pool)
+
+        dns_ip = getattr(self.config, 'dns', None)
+        if dns_ip and dns_ip.lower() != "auto":
+            from aiohttp.resolver import AsyncResolver
+            return aiohttp.TCPConnector(resolver=AsyncResolver(nameservers=[dns_ip]), **pool)
+
+        # Always use ThreadedResolver (system DNS via socket API) otherwise,
+        # including when the "auto" DNS scan failed.
+        # This is critical on Windows with VPNs: aiodns (the aiohttp
+        # default) queries DNS directly and bypasses the VPN tunnel,
+        # causing timeouts. ThreadedResolver calls getaddrinfo() which
+        # respects the OS routing table and VPN adapter.
+        from aiohttp.resolver import ThreadedResolver
+        return aiohttp.TCPConnector(resolver=ThreadedResolver(), **pool)
+
     async def shutdown(self) -> None:
-        """Close HTTP session."""
+        """Close HTTP sessions."""
         if self.session and not self.session.closed:
             await self.session.close()
+        if self.api_session and not self.api_session.closed:
+            await self.api_session.close()
 
     async def fetch(self, endpoint: str, params: dict = None) -> Optional[dict]:
         """Fetch JSON data from API endpoint."""
         await self.boot()
-        
-        # Rate limiting: 0.5s between requests
+        await self._wait_rate_limit()
+        return await self._get_json(endpoint, params)
+
+    async def fetch_pair(self, endpoint: str, companion: str) -> Tuple[Optional[dict], asyncio.Task]:
+        """Fetch endpoint and start companion in the same rate-limit slot; the caller awaits or cancels the companion task."""
+        await self.boot()
+        await self._wait_rate_limit()
+        companion_task = asyncio.create_task(self._get_json(companion))
+        try:
+            return await self._get_json(endpoint), companion_task
+        except BaseException:
+            companion_task.cancel()
+            raise
+
+    async def _wait_rate_limit(self) -> None:
+        """Rate limiting: 0.5s between request slots."""
         async with self._rate_limit_lock:
             now = time.time()
             elapsed = now - self._last_req
@@ -87,19 +140,21 @@ class NetworkKernel:
                 await asyncio.sleep(0.5 - elapsed)
             self._last_req = time.time()
 
+    async def _get_json(self, endpoint: str, params: dict = None) -> Optional[dict]:
+        """GET an API endpoint with retries and decode its JSON body."""
         url = f"{self.config.mirror}{endpoint}"
-        proxy = self.config.proxy if self.config.proxy and not self.config.proxy.startswith("socks") else None
+        proxy = self._http_proxy
 
         for attempt in range(3):
             try:
-                async with self.session.get(url, params=params, proxy=proxy) as resp:
+                async with self.api_session.get(url, params=params, proxy=proxy) as resp:
                     if resp.status == 429:  # Rate limit
                         await asyncio.sleep(2 ** (attempt + 2))
                         continue
                     if resp.status == 404:
                         return None
                     resp.raise_for_status()
-                    return await resp.json()
+                    return _json_loads(await resp.read())
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logging.warning(f"API request failed on attempt {attempt + 1}/3 for {url}: {e}")
                 if attempt == 2:
@@ -113,9 +168,8 @@ class NetworkKernel:
     async def stream(self, url, headers: dict = None) -> aiohttp.ClientResponse:
         """Stream a file download."""
         await self.boot()
-        proxy = self.config.proxy if self.config.proxy and not self.config.proxy.startswith("socks") else None
+        proxy = self._http_proxy
         
-        import yarl
         if isinstance(url, yarl.URL):
             cdn_url = url
             url_str = str(url)
@@ -126,8 +180,7 @@ class NetworkKernel:
         # If the URL points to the CDN (not the API mirror), download directly.
         # The mirror-rotation logic is only for API endpoints; CDN hostnames are
         # different servers and should never have their host swapped.
-        api_hosts = {yarl.URL(m).host for m in HOSTNAME_MIRRORS}
-        if cdn_url.host not in api_hosts:
+        if cdn_url.host not in _API_HOSTS:
             try:
                 resp = await self.session.get(cdn_url, headers=headers, proxy=proxy)
                 return resp
@@ -1,24 +1,127 @@
 import os
-import re
+import contextlib
+import functools
+import json
 import sys
 import time
 import urllib.parse
 import asyncio
 import logging
-import aiofiles
 from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, Optional, Set
 
 from rich.progress import Progress, TaskID
 from main.progress import ProgressReporter
 
-from main.constants import CHUNK_SIZE
+from main.constants import CHUNK_SIZE, SEGMENT_COUNT, SEGMENT_MIN_SIZE, WRITE_BUFFER_SIZE
 from main.models import WorkMetadata, TrackItem, SessionStats
 from main.config import ConfigManager
 from main.db import LibraryVault
 from main.network import NetworkKernel
-from main.audio import AudioProcessor
+from main.audio import AudioProcessor, CoverArt
+
+
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows opens descriptors in text mode otherwise
+# Download writes get their own threads so they never queue behind tagging, disk scans
+# or ThreadedResolver lookups in the loop's default executor
+_DISK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="disk-io")
+
+_PROGRESS_INTERVAL = 0.1  # seconds of received bytes folded into one progress update
+
+# Characters invalid in Windows filenames become "_"; control characters are dropped
+_SANITIZE_TABLE = str.maketrans({**{c: "_" for c in '<>:"/\\|?*'}, **{chr(c): None for c in range(0x20)}})
+
+AUDIO_EXTS = frozenset({'.mp3', '.wav', '.flac', '.m4a', '.ogg'})
+IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+TEXT_EXTS = frozenset({'.txt', '.pdf', '.doc', '.docx'})
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    """Write all of data at an absolute offset; the descriptor must have a single writer."""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, view, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve disk blocks for a file, or just extend it where fallocate is unavailable."""
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+def _ranges_path(part_path: Path) -> Path:
+    """Sidecar recording the byte ranges a segmented part file still needs."""
+    return part_path.with_suffix(".ranges.tmp")
+
+
+def _ranges_left(segments: List[List[int]]) -> int:
+    """Count the bytes still missing from a list of [next_offset, end] ranges."""
+    return sum(end + 1 - start for start, end in segments if start <= end)
+
+
+def _store_ranges(part_path: Path, segments: List[List[int]]) -> None:
+    """Record the unfinished ranges next to the part file, or drop the record once none are left."""
+    sidecar = _ranges_path(part_path)
+    if _ranges_left(segments):
+        sidecar.write_text(json.dumps(segments), encoding="utf-8")
+    else:
+        sidecar.unlink(missing_ok=True)
+
+
+def _load_ranges(part_path: Path, size: int) -> Optional[List[List[int]]]:
+    """Read back the unfinished ranges of a part file, or None if the record can't be trusted."""
+    try:
+        if os.path.getsize(part_path) != size:
+            return None
+        segments = json.loads(_ranges_path(part_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(segments, list) or not all(
+        isinstance(seg, list) and len(seg) == 2 and all(isinstance(v, int) for v in seg)
+        and 0 <= seg[0] <= seg[1] + 1 and seg[1] < size
+        for seg in segments
+    ):
+        return None
+    return segments
+
+
+class _ProgressBatch:
+    """Fold per-chunk byte counts into at most one progress update per interval."""
+    __slots__ = ("prog", "tasks", "pending", "last")
+
+    def __init__(self, prog: ProgressReporter, *tasks: Any):
+        self.prog = prog
+        self.tasks = tasks
+        self.pending = 0
+        self.last = time.monotonic()
+
+    def add(self, n: int) -> None:
+        self.pending += n
+        now = time.monotonic()
+        if now - self.last >= _PROGRESS_INTERVAL:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        if self.pending:
+            for task in self.tasks:
+                self.prog.update_task(task, advance=self.pending)
+            self.pending = 0
+        self.last = time.monotonic() if now is None else now
 
 
 class Orchestrator:
@@ -28,8 +131,11 @@ class Orchestrator:
         self.config = config
         self.db = db
         self.stats = SessionStats()
-        self.sem = asyncio.Semaphore(config.max_concurrent)
+        # Progress rows of finished transfers, hidden until download_file lends them out again
+        self._idle_rows: List[Any] = []
         self.logs: List[str] = []  # UI logs
+        self.log_event = asyncio.Event()  # set whenever a UI log line is added
+        self._created_dirs: Set[str] = set()  # parent folders already ensured for this work
         self._tokens = 0.0
         self._last_token_update = time.time()
         self._token_lock = asyncio.Lock()
@@ -42,6 +148,9 @@ class Orchestrator:
 
         # Compute sleep time under the lock, but sleep OUTSIDE it
         # so other concurrent downloads are not blocked during the wait.
+        # Tokens may go negative: each caller reserves its bytes as debt, so
+        # concurrent waiters (files and their byte ranges) queue behind one
+        # another and the limit stays global.
         async with self._token_lock:
             now = time.time()
             elapsed = now - self._last_token_update
@@ -50,25 +159,132 @@ class Orchestrator:
                 limit_bytes_per_sec
             )
             self._last_token_update = now
-            sleep_time = max(0.0, (chunk_size - self._tokens) / limit_bytes_per_sec)
-            self._tokens = max(0.0, self._tokens - chunk_size)
+            self._tokens -= chunk_size
+            sleep_time = max(0.0, -self._tokens / limit_bytes_per_sec)
 
         if sleep_time > 0:
             await asyncio.sleep(sleep_time)
 
+    @staticmethod
+    async def _drain_writes(fd: int, offset: int, queue: asyncio.Queue) -> None:
+        """Write queued chunks at increasing offsets from the executor until a None sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        error: Optional[OSError] = None
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                # Keep draining after a failed write so the producer never blocks on a full queue
+                if error is None:
+                    try:
+                        await loop.run_in_executor(_DISK_EXECUTOR, _pwrite, fd, chunk, offset)
+                        offset += len(chunk)
+                    except OSError as e:
+                        error = e
+        finally:
+            await loop.run_in_executor(_DISK_EXECUTOR, os.close, fd)
+        if error is not None:
+            raise error
+
+    async def _plan_segments(self, track: TrackItem) -> List[List[int]]:
+        """Split a file into byte ranges if the server honours Range requests, else return []."""
+        try:
+            async with await self.kernel.stream(track.url, {"Range": "bytes=0-0"}) as resp:
+                content_range = resp.headers.get("Content-Range", "")
+                if resp.status != 206 or not content_range.endswith(f"/{track.size}"):
+                    return []
+        except Exception as e:
+            logging.debug(f"Range probe failed for {track.title}: {e}")
+            return []
+
+        step = -(-track.size // SEGMENT_COUNT)
+        return [[start, min(start + step, track.size) - 1] for start in range(0, track.size, step)]
+
+    async def _download_segments(self, track: TrackItem, part_path: Path, segments: List[List[int]],
+                                 prog: ProgressReporter, main_task: Any, file_task: Any) -> None:
+        """Fetch the outstanding byte ranges concurrently into a preallocated part file."""
+        loop = asyncio.get_running_loop()
+        if not part_path.exists():
+            def allocate() -> None:
+                fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | _O_BINARY)
+                try:
+                    _preallocate(fd, track.size)
+                finally:
+                    os.close(fd)
+                _store_ranges(part_path, segments)
+            await loop.run_in_executor(_DISK_EXECUTOR, allocate)
+
+        async def fetch(seg: List[int]) -> None:
+            # One descriptor per range keeps the lseek fallback of _pwrite safe
+            fd = await loop.run_in_executor(_DISK_EXECUTOR, os.open, part_path, os.O_WRONLY | _O_BINARY)
+            try:
+                async with await self.kernel.stream(track.url, {"Range": f"bytes={seg[0]}-{seg[1]}"}) as resp:
+                    if resp.status != 206:
+                        raise Exception(f"HTTP {resp.status} for byte range {seg[0]}-{seg[1]}")
+                    # seg[0] only moves once bytes are on disk, so a retry resumes from there
+                    buf = bytearray()
+                    try:
+                        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                            chunk = chunk[:seg[1] + 1 - seg[0] - len(buf)]
+                            await self._consume_bandwidth(len(chunk))
+                            buf += chunk
+                            if len(buf) >= WRITE_BUFFER_SIZE:
+                                await loop.run_in_executor(_DISK_EXECUTOR, _pwrite, fd, buf, seg[0])
+                                seg[0] += len(buf)
+                                buf = bytearray()
+                            progress.add(len(chunk))
+                            self.stats.bytes_downloaded += len(chunk)
+                    finally:
+                        # Received bytes are contiguous from seg[0], so keep them even if the stream broke;
+                        # otherwise a retry would fetch and count them again
+                        if buf:
+                            await loop.run_in_executor(_DISK_EXECUTOR, _pwrite, fd, buf, seg[0])
+                            seg[0] += len(buf)
+            finally:
+                await loop.run_in_executor(_DISK_EXECUTOR, os.close, fd)
+
+        # Let every range settle before raising so no writer outlives this attempt
+        progress = _ProgressBatch(prog, main_task, file_task)
+        try:
+            results = await asyncio.gather(*(fetch(seg) for seg in segments if seg[0] <= seg[1]), return_exceptions=True)
+        finally:
+            progress.flush()
+            # Only offsets already written are recorded, so a later run can resume the ranges safely
+            await loop.run_in_executor(_DISK_EXECUTOR, _store_ranges, part_path, segments)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if any(seg[0] <= seg[1] for seg in segments):
+            raise Exception(f"Byte ranges incomplete for {track.title}")
+
+    @contextlib.contextmanager
+    def _transfer_slot(self, prog: ProgressReporter, description: str, total: int):
+        """Lend a transfer a progress row, reusing a hidden one when available."""
+        # Concurrency is bounded by download_all's worker pool, so rows never outnumber workers
+        if self._idle_rows:
+            row = self._idle_rows.pop()
+            prog.reset_task(row, description=description, total=total)
+        else:
+            row = prog.add_task(description, total=total)
+        try:
+            yield row
+        finally:
+            prog.reset_task(row, visible=False)
+            self._idle_rows.append(row)
+
     def log_ui(self, msg: str) -> None:
         """Add a log message to UI display."""
         timestamp = datetime.now().strftime('%H:%M:%S')
         self.logs.append(f"[{timestamp}] {msg}")
         if len(self.logs) > 10:
             self.logs.pop(0)
+        self.log_event.set()
 
     @staticmethod
     def sanitize(name: str) -> str:
         """Sanitize filename by removing invalid characters."""
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
-        name = re.sub(r'[\x00-\x1f]', '', name)
-        return name.strip()[:200]
+        return name.translate(_SANITIZE_TABLE).strip()[:200]
 
     def get_save_path(self, meta: WorkMetadata) -> Path:
         """Generate save path for a work based on template."""
@@ -86,18 +302,48 @@ class Orchestrator:
         
         return self.config.output_dir / folder
 
+    @staticmethod
+    def scan_disk_state(tracks: List[TrackItem]) -> None:
+        """Cache finished sizes and resumable part progress using one directory listing per folder."""
+        by_parent = defaultdict(list)
+        for track in tracks:
+            by_parent[track.save_path.parent].append(track)
+
+        for parent, group in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+
+            def size_of(name: str) -> Optional[int]:
+                entry = entries.get(name)
+                try:
+                    return entry.stat().st_size if entry is not None and entry.is_file() else None
+                except OSError:
+                    return None
+
+            for track in group:
+                track.disk_size = size_of(track.save_path.name)
+                track.tmp_size = size_of(track.save_path.name + ".tmp")
+                seg_name = track.save_path.name + ".seg.tmp"
+                if track.tmp_size is None and seg_name in entries:
+                    segments = _load_ranges(parent / seg_name, track.size)
+                    if segments is not None:
+                        track.tmp_size = track.size - _ranges_left(segments)
+
     def categorize_path(self, root: Path, filename: str, ftype: str) -> Path:
         """Categorize file into appropriate subdirectory."""
         if not self.config.sort_files:
             return root / filename
             
-        ext = Path(filename).suffix.lower()
+        ext = os.path.splitext(filename)[1].lower()
         
-        if ftype == 'audio' or ext in ['.mp3', '.wav', '.flac', '.m4a', '.ogg']:
+        if ftype == 'audio' or ext in AUDIO_EXTS:
             return root / "Audio" / filename
-        elif ftype == 'image' or ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']:
+        elif ftype == 'image' or ext in IMAGE_EXTS:
             return root / "Images" / filename
-        elif ftype == 'text' or ext in ['.txt', '.pdf', '.doc', '.docx']:
+        elif ftype == 'text' or ext in TEXT_EXTS:
             return root / "Text" / filename
         else:
             return root / "Other" / filename
@@ -105,91 +351,165 @@ class Orchestrator:
     def parse_hierarchy(self, data: List[dict], root_path: Path, 
                        base_path: Path, level: int = 0) -> List[TrackItem]:
         """Parse hierarchical track data into TrackItem objects."""
-        items = []
-        
-        for node in data:
-            title = self.sanitize(node.get("title", "Unknown"))
-            
-            if node.get("type") == "folder":
-                folder_item = TrackItem(
-                    id="dir",
-                    title=title,
-                    type="folder",
-                    url="",
-                    size=0,
-                    save_path=root_path / title,
-                    level=level
-                )
-                children = node.get("children", [])
-                folder_item.children = self.parse_hierarchy(
-                    children, 
-                    root_path / title, 
-                    base_path, 
-                    level + 1
-                )
-                items.append(folder_item)
-                
-            elif "mediaDownloadUrl" in node:
-                if self.config.sort_files:
-                    save_path = self.categorize_path(base_path, title, node.get("type", "file"))
-                else:
-                    save_path = root_path / title
-                
-                import yarl
-                raw_url = node["mediaDownloadUrl"]
+        import yarl
+
+        items: List[TrackItem] = []
+        # Walk the tree with an explicit stack; each entry fills one sibling list in place
+        sibling_lists = []
+        stack = [(data, root_path, level, items)]
+        while stack:
+            nodes, folder_path, depth, out = stack.pop()
+            sibling_lists.append(out)
+
+            for node in nodes:
+                title = self.sanitize(node.get("title", "Unknown"))
                 
-                track = TrackItem(
-                    id=node.get("id", ""),
-                    title=title,
-                    type=node.get("type", "file"),
-                    url=yarl.URL(raw_url, encoded=True),
-                    size=node.get("size", 0),
-                    save_path=save_path,
-                    level=level
-                )
-                items.append(track)
+                if node.get("type") == "folder":
+                    child_path = folder_path / title
+                    folder_item = TrackItem(
+                        id="dir",
+                        title=title,
+                        type="folder",
+                        url="",
+                        size=0,
+                        save_path=child_path,
+                        level=depth
+                    )
+                    stack.append((node.get("children", []), child_path, depth + 1, folder_item.children))
+                    out.append(folder_item)
+                    
+                elif "mediaDownloadUrl" in node:
+                    if self.config.sort_files:
+                        save_path = self.categorize_path(base_path, title, node.get("type", "file"))
+                    else:
+                        save_path = folder_path / title
+                    
+                    track = TrackItem(
+                        id=node.get("id", ""),
+                        title=title,
+                        type=node.get("type", "file"),
+                        url=yarl.URL(node["mediaDownloadUrl"], encoded=True),
+                        size=node.get("size", 0),
+                        save_path=save_path,
+                        level=depth
+                    )
+                    out.append(track)
                 
         # Deduplicate identical files (by stem) using format_priority
         if self.config.format_priority:
-            deduped = []
-            file_groups = {}
-            for item in items:
-                if item.type == "folder":
-                    deduped.append(item)
-                else:
-                    stem = Path(item.title).stem
-                    file_groups.setdefault(stem, []).append(item)
-            
-            for stem, group in file_groups.items():
-                if len(group) == 1:
-                    deduped.append(group[0])
-                else:
-                    # Sort group by priority. If extension not in priority list, treat as lowest priority
-                    def get_priority(it: TrackItem) -> int:
-                        ext = Path(it.title).suffix.lstrip('.').lower()
-                        try:
-                            return self.config.format_priority.index(ext)
-                        except ValueError:
-                            return 999
-                    group.sort(key=get_priority)
-                    deduped.append(group[0])
-                    
-            items = deduped
+            # Rank lookup built once instead of a list.index() scan per file
+            rank = {}
+            for i, ext in enumerate(self.config.format_priority):
+                rank.setdefault(ext, i)
+            for out in sibling_lists:
+                out[:] = self._dedupe_formats(out, rank)
 
         return items
 
+    @staticmethod
+    def _dedupe_formats(items: List[TrackItem], rank: dict) -> List[TrackItem]:
+        """Keep only the highest priority format among sibling files that share a stem."""
+        deduped = []
+        file_groups = defaultdict(list)  # stem -> [(rank, item)]
+        for item in items:
+            if item.type == "folder":
+                deduped.append(item)
+            else:
+                stem, ext = os.path.splitext(item.title)
+                # If extension not in priority list, treat as lowest priority
+                file_groups[stem].append((rank.get(ext.lstrip('.').lower(), 999), item))
+        
+        for group in file_groups.values():
+            if len(group) == 1:
+                deduped.append(group[0][1])
+            else:
+                deduped.append(min(group, key=itemgetter(0))[1])
+                
+        return deduped
+
+    @staticmethod
+    def _make_dirs(dirs: Set[str]) -> Set[str]:
+        """Create the given folders, returning the ones that now exist."""
+        created = set()
+        for d in dirs:
+            try:
+                os.makedirs(d, exist_ok=True)
+                created.add(d)
+            except OSError:
+                pass
+        return created
+
+    @staticmethod
+    def _finalize(part_path: Path, path: Path, track: TrackItem, meta: WorkMetadata,
+                  cover: Optional[CoverArt], tag: bool) -> None:
+        """Verify a finished part file, move it into place and tag it, all in one worker hop."""
+        try:
+            actual_size = part_path.stat().st_size
+        except FileNotFoundError:
+            raise Exception(f"Temp file missing after download for {track.title}") from None
+        # track.size == 0 means the server didn't report a size
+        if track.size > 0 and actual_size != track.size:
+            raise Exception(f"File size mismatch. Expected {track.size}, got {actual_size}")
+        os.replace(part_path, path)
+        if tag:
+            AudioProcessor.apply_tags(path, meta, cover)
+
+    async def download_cover(self, url: str, root_path: Path) -> Optional[Path]:
+        """Stream the work's cover image to root_path/cover.jpg, returning None on failure."""
+        target = root_path / "cover.jpg"
+        part = root_path / "cover.jpg.tmp"
+        loop = asyncio.get_running_loop()
+        try:
+            async with await self.kernel.stream(url) as resp:
+                if resp.status != 200:
+                    return None
+                fd = await loop.run_in_executor(_DISK_EXECUTOR, os.open, part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY)
+                try:
+                    offset = 0
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        await loop.run_in_executor(_DISK_EXECUTOR, _pwrite, fd, chunk, offset)
+                        offset += len(chunk)
+                finally:
+                    await loop.run_in_executor(_DISK_EXECUTOR, os.close, fd)
+            # Swap in only a complete image so tagging never embeds a truncated cover
+            await loop.run_in_executor(_DISK_EXECUTOR, os.replace, part, target)
+            return target
+        except Exception as e:
+            logging.debug(f"Cover download failed for {url}: {e}")
+            await loop.run_in_executor(_DISK_EXECUTOR, functools.partial(part.unlink, missing_ok=True))
+            return None
+
+    async def download_all(self, tracks: List[TrackItem], meta: WorkMetadata,
+                           prog: ProgressReporter, main_task: Any, cover: Optional[CoverArt]) -> None:
+        """Download tracks with a fixed pool of max_concurrent workers."""
+        # Create every target folder up front in one worker hop; download_file reports any failures
+        parents = {str(track.save_path.parent) for track in tracks} - self._created_dirs
+        self._created_dirs |= await asyncio.to_thread(self._make_dirs, parents)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for track in tracks:
+            queue.put_nowait(track)
+        self._idle_rows = []  # rows belong to the reporter of a single call
+
+        async def worker() -> None:
+            while not queue.empty():
+                await self.download_file(queue.get_nowait(), meta, prog, main_task, cover)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.config.max_concurrent, len(tracks)))))
+
     async def download_file(self, track: TrackItem, meta: WorkMetadata, 
-                           prog: ProgressReporter, main_task: Any, cover: Path) -> None:
+                           prog: ProgressReporter, main_task: Any, cover: Optional[CoverArt]) -> None:
         """Download a single file with individual progress tracking."""
         path = track.save_path
+        loop = asyncio.get_running_loop()
         logging.debug(f"[{meta.rj_id}] Starting download loop for {track.title} -> {path}")
-        
-        # Add an individual progress task for this specific file
-        file_task = prog.add_task(f"[cyan]Downloading: {track.title[:30]}[/cyan]", total=track.size)
 
         # Ensure parent directory exists before applying Windows \\?\ long path prefix
+        parent = str(path.parent)
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            if parent not in self._created_dirs:
+                os.makedirs(parent, exist_ok=True)
+                self._created_dirs.add(parent)
         except OSError as e:
             self.log_ui(f"[red]Failed to create directory: {e}[/red]")
             logging.exception(f"Failed to create directory {path.parent} for {track.title}")
@@ -202,6 +522,8 @@ class Orchestrator:
             path = Path("\\\\?\\" + str(path.resolve()))
             
         tmp_path = Path(str(path) + ".tmp")
+        seg_path = Path(str(path) + ".seg.tmp")
+        segments = None  # [next_offset, end] per byte range once a ranged download is chosen
 
         for attempt in range(20):
             try:
@@ -211,7 +533,6 @@ class Orchestrator:
                         self.stats.skipped += 1
                         logging.debug(f"[{meta.rj_id}] File {track.title} already completed in DB and exists on disk. Skipping.")
                     prog.update_task(main_task, advance=track.size)
-                    prog.remove_task(file_task)
                     return
 
                 # If the final file exists and is the correct size, we're done
@@ -219,7 +540,6 @@ class Orchestrator:
                     if attempt == 0:
                         self.stats.skipped += 1
                     prog.update_task(main_task, advance=track.size)
-                    prog.remove_task(file_task)
                     return
 
                 existing_size = tmp_path.stat().st_size if tmp_path.exists() else 0
@@ -231,59 +551,88 @@ class Orchestrator:
                 headers = {"Range": f"bytes={existing_size}-"} if existing_size else {}
                 if existing_size:
                     logging.debug(f"[{meta.rj_id}] Resuming {track.title} from byte {existing_size}")
-                    prog.update_task(file_task, completed=existing_size)
                 
-                async with self.sem:
-                    async with await self.kernel.stream(track.url, headers) as resp:
-                        if resp.status == 416:
-                            # Range not satisfiable, start over
-                            existing_size = 0
-                            headers = {}
-                            if tmp_path.exists():
-                                tmp_path.unlink()
-                            # It will retry on the next attempt loop iteration
-                            raise Exception("HTTP 416 Range Not Satisfiable")
+                description = f"[cyan]Downloading: {track.title[:30]}[/cyan]"
+                with self._transfer_slot(prog, description, track.size) as file_task:
+                    if segments is None:
+                        use_ranges = not existing_size and track.size >= SEGMENT_MIN_SIZE
+                        segments = await self._plan_segments(track) if use_ranges else []
+                        if segments:
+                            # Continue the ranges an earlier run left unfinished; without a
+                            # trustworthy record its part file is started over
+                            saved = await loop.run_in_executor(_DISK_EXECUTOR, _load_ranges, seg_path, track.size)
+                            if saved is not None:
+                                segments = saved
+                                logging.debug(f"[{meta.rj_id}] Resuming {track.title} with {_ranges_left(segments)} bytes left")
+                            elif seg_path.exists():
+                                seg_path.unlink()
+                    if segments:
+                        done = track.size - _ranges_left(segments)
+                    else:
+                        done = existing_size
+                    prog.update_task(file_task, completed=done)
+                    if segments:
+                        await self._download_segments(track, seg_path, segments, prog, main_task, file_task)
+                    else:
+                        async with await self.kernel.stream(track.url, headers) as resp:
+                            if resp.status == 416:
+                                # Range not satisfiable, start over
+                                existing_size = 0
+                                headers = {}
+                                if tmp_path.exists():
+                                    tmp_path.unlink()
+                                # It will retry on the next attempt loop iteration
+                                raise Exception("HTTP 416 Range Not Satisfiable")
                             
-                        if resp.status not in [200, 206]:
-                            if attempt == 19:
-                                self.stats.failed += 1
-                                reason = f"HTTP {resp.status}"
-                                self.stats.failures.append((track.title, reason))
-                                msg = f"Failed: {track.title} ({reason}) - URL: {track.url}"
-                                self.log_ui(f"[red]{msg}[/red]")
-                                logging.error(msg)
-                            continue
+                            if resp.status not in [200, 206]:
+                                if attempt == 19:
+                                    self.stats.failed += 1
+                                    reason = f"HTTP {resp.status}"
+                                    self.stats.failures.append((track.title, reason))
+                                    msg = f"Failed: {track.title} ({reason}) - URL: {track.url}"
+                                    self.log_ui(f"[red]{msg}[/red]")
+                                    logging.error(msg)
+                                continue
                         
-                        mode = "ab" if resp.status == 206 else "wb"
-                        async with aiofiles.open(tmp_path, mode) as f:
-                            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
-                                await self._consume_bandwidth(len(chunk))
-                                await f.write(chunk)
-                                prog.update_task(main_task, advance=len(chunk))
-                                prog.update_task(file_task, advance=len(chunk))
-                                self.stats.bytes_downloaded += len(chunk)
-                
-                # Verify download completed successfully
-                if tmp_path.exists():
-                    actual_size = tmp_path.stat().st_size
-                    if track.size > 0 and actual_size != track.size:
-                        raise Exception(
-                            f"File size mismatch. Expected {track.size}, got {actual_size}"
-                        )
-                    # Rename .tmp -> final path (track.size == 0 means server didn't report size)
-                    if path.exists():
-                        path.unlink()
-                    tmp_path.rename(path)
-                    logging.debug(f"[{meta.rj_id}] Successfully downloaded {track.title}")
-                else:
-                    raise Exception(f"Temp file missing after download for {track.title}")
+                            # 206 continues the .tmp at its current size; 200 rewrites it from the start
+                            flags = os.O_WRONLY | os.O_CREAT | _O_BINARY
+                            if resp.status == 206:
+                                offset = existing_size
+                            else:
+                                flags |= os.O_TRUNC
+                                offset = 0
+                            queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+                            fd = await loop.run_in_executor(_DISK_EXECUTOR, os.open, tmp_path, flags)
+                            writer = asyncio.create_task(self._drain_writes(fd, offset, queue))
+                            # Chunks are batched so the executor sees one write per WRITE_BUFFER_SIZE
+                            buf = bytearray()
+                            progress = _ProgressBatch(prog, main_task, file_task)
+                            try:
+                                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                                    await self._consume_bandwidth(len(chunk))
+                                    buf += chunk
+                                    if len(buf) >= WRITE_BUFFER_SIZE:
+                                        await queue.put(buf)
+                                        buf = bytearray()
+                                    progress.add(len(chunk))
+                                    self.stats.bytes_downloaded += len(chunk)
+                            finally:
+                                progress.flush()
+                                # Received bytes are contiguous, so keep them for resume even if the stream broke
+                                if buf:
+                                    await queue.put(buf)
+                                await queue.put(None)
+                                await writer
                 
-                if self.config.tag_audio and track.type == 'audio':
-                    await asyncio.to_thread(AudioProcessor.apply_tags, path, meta, cover)
+                # Verify the part file, move it into place and tag it off the event loop
+                part_path = seg_path if segments else tmp_path
+                tag = self.config.tag_audio and track.type == 'audio'
+                await asyncio.to_thread(self._finalize, part_path, path, track, meta, cover, tag)
+                logging.debug(f"[{meta.rj_id}] Successfully downloaded {track.title}")
                 
                 self.db.file_state_update(meta.rj_id, str(path), track.size, track.size, 'completed')
+                track.disk_size, track.tmp_size = None, None  # cached scan no longer reflects disk
                 self.stats.success += 1
-                prog.remove_task(file_task)
                 return
                 
             except Exception as e:
@@ -294,7 +643,6 @@ class Orchestrator:
                     self.stats.failures.append((track.title, reason))
                     msg = f"Failed: {track.title} ({type(e).__name__})"
                     self.log_ui(f"[red]{msg}[/red]")
-                    prog.remove_task(file_task)
                     return
                 await asyncio.sleep(1)
 
@@ -303,11 +651,10 @@ class Orchestrator:
         if not getattr(self.config, 'create_playlist', True) or not root_path.exists():
             return
         
-        audio_exts = {'.mp3', '.flac', '.wav', '.m4a', '.ogg'}
         audio_files = []
         
         for file_path in root_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in audio_exts:
+            if file_path.is_file() and file_path.suffix.lower() in AUDIO_EXTS:
                 if not file_path.name.endswith('.tmp'):
                     try:
                         rel_path = file_path.relative_to(root_path)
@@ -11,6 +11,10 @@ class ProgressReporter(Protocol):
     def remove_task(self, task_id: Any) -> None:
         ...
 
+    def reset_task(self, task_id: Any, description: Optional[str] = None,
+                   total: Optional[float] = None, visible: bool = True) -> None:
+        ...
+
 class RichProgressReporter:
     def __init__(self, prog: Progress):
         self.prog = prog
@@ -28,3 +32,7 @@ class RichProgressReporter:
 
     def remove_task(self, task_id: TaskID) -> None:
         self.prog.remove_task(task_id)
+
+    def reset_task(self, task_id: TaskID, description: Optional[str] = None,
+                   total: Optional[float] = None, visible: bool = True) -> None:
+        self.prog.reset(task_id, description=description, total=total, visible=visible)